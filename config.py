@@ -4,10 +4,27 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+
+def _parse_chat_id(value):
+    """Return numeric chat IDs as int and keep @channel usernames as given."""
+    value = (value or '').strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
 # Bot Configuration
 BOT_TOKEN = os.getenv('BOT_TOKEN')
-ADMIN_IDS = [int(id) for id in os.getenv('ADMIN_IDS', '').split(',') if id]
-REPORT_CHANNEL_ID = os.getenv('REPORT_CHANNEL_ID')  # Channel where reports will be sent
+ADMIN_IDS = tuple(int(id) for id in os.getenv('ADMIN_IDS', '').split(',') if id)
+ADMIN_IDS_SET = frozenset(ADMIN_IDS)  # For O(1) admin membership checks
+REPORT_CHANNEL_ID = _parse_chat_id(os.getenv('REPORT_CHANNEL_ID'))  # Channel where reports will be sent
+
+# Webhook Configuration (Optional - falls back to polling when WEBHOOK_URL is unset)
+WEBHOOK_URL = os.getenv('WEBHOOK_URL', '')
+PORT = int(os.getenv('PORT', 8443))
 
 # MongoDB Configuration (Optional - for storing reports)
 MONGODB_URI = os.getenv('MONGODB_URI', '')
@@ -16,3 +33,5 @@ DATABASE_NAME = os.getenv('DATABASE_NAME', 'telegram_reports')
 # Bot Settings
 MAX_REPORT_LENGTH = 1000
 REPORT_COOLDOWN = 60  # Seconds between reports from same user
+REPORT_BATCH_SIZE = 500  # Max reports per database write
+REPORT_FLUSH_INTERVAL = 3  # Seconds to wait for a batch to fill before writing
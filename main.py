@@ -6,12 +6,22 @@ Can be deployed on Railway.app
 
 import logging
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, Optional
+import itertools
+import random
+import signal
+import time
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Dict
 import re
 
+import certifi
+import orjson
+from pymongo import MongoClient
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.error import TelegramError
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     CommandHandler,
     MessageHandler,
@@ -20,6 +30,7 @@ from telegram.ext import (
     filters,
     ContextTypes
 )
+from telegram.request import HTTPXRequest
 
 import config
 
@@ -28,24 +39,155 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     level=logging.INFO
 )
+# httpx logs every request at INFO, which floods the output under load
+logging.getLogger("httpx").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 # Conversation states
 REPORT_TYPE, REPORT_TARGET, REPORT_REASON, REPORT_DETAILS, CONFIRMATION = range(5)
 
 # Report types
-REPORT_TYPES = {
+REPORT_TYPES = MappingProxyType({
     'user': '👤 User',
     'group': '👥 Group',
     'channel': '📢 Channel'
-}
+})
+
+# Report reasons as (key, label) pairs, in keyboard order
+_REASONS = (
+    ('spam', '📧 Spam'),
+    ('scam', '💰 Scam/Fraud'),
+    ('harassment', '⚠️ Harassment'),
+    ('illegal', '🚫 Illegal Content'),
+    ('impersonation', '👤 Impersonation'),
+    ('other', '📌 Other'),
+)
+
+# Capitalized reason keys, as shown in summaries and forwarded reports
+_REASON_LABELS = MappingProxyType({key: key.capitalize() for key, _ in _REASONS})
+
+# Static inline keyboards, shared by every conversation
+_CANCEL_BUTTON = InlineKeyboardButton('❌ Cancel', callback_data='cancel')
+
+_TYPE_KEYBOARD = InlineKeyboardMarkup(
+    [[InlineKeyboardButton(label, callback_data=f'type_{key}')] for key, label in REPORT_TYPES.items()]
+    + [[_CANCEL_BUTTON]]
+)
+
+_REASON_KEYBOARD = InlineKeyboardMarkup(
+    [[InlineKeyboardButton(label, callback_data=f'reason_{key}')] for key, label in _REASONS]
+    + [[_CANCEL_BUTTON]]
+)
+
+_CONFIRM_KEYBOARD = InlineKeyboardMarkup([
+    [InlineKeyboardButton('✅ Confirm', callback_data='confirm'), _CANCEL_BUTTON]
+])
+
+
+def _admin_keyboard(user_id: int) -> InlineKeyboardMarkup:
+    """Build the resolve/reject keyboard attached to admin copies of a report."""
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton('✅ Resolve', callback_data=f'resolve_{user_id}'),
+            InlineKeyboardButton('❌ Reject', callback_data=f'reject_{user_id}')
+        ]
+    ])
+
+
+# Status lines appended to a report when an admin acts on it
+_ADMIN_VERDICTS = MappingProxyType({
+    'resolve': "✅ **Report resolved by admin**",
+    'reject': "❌ **Report rejected by admin**",
+})
+
+# Message templates for the confirmation summary and the forwarded report
+_SUMMARY_TMPL = (
+    "📋 **Please confirm your report:**\n\n"
+    "**Type:** {type}\n"
+    "**Target:** {target}\n"
+    "**Reason:** {reason}\n"
+    "**Details:** {details}"
+)
+
+_REPORT_TMPL = (
+    "🚨 **NEW REPORT**\n\n"
+    "**Report ID:** #{rid}\n"
+    "**Date:** {date}\n"
+    "**Reporter:** {name} (ID: `{uid}`)\n"
+    "**Type:** {type}\n"
+    "**Target:** {target}\n"
+    "**Reason:** {reason}\n"
+    "**Details:** {details}\n"
+)
+
+# Inline selections: callback prefix -> (user_data key, next state, labels, prompt template)
+_SELECTION_STEPS = MappingProxyType({
+    'type': (
+        'report_type',
+        REPORT_TARGET,
+        REPORT_TYPES,
+        "📝 You selected: **{label}**\n\n"
+        "Please send the username or invite link of the {value} you want to report.\n\n"
+        "Examples:\n"
+        "• Username: @username\n"
+        "• Link: https://t.me/username\n"
+        "• Group link: https://t.me/+abc123..."
+    ),
+    'reason': (
+        'report_reason',
+        REPORT_DETAILS,
+        _REASON_LABELS,
+        "📝 **Please provide additional details:**\n\n"
+        "Include any relevant information that might help us investigate this report.\n"
+        "Maximum {max_length} characters.\n\n"
+        "Send /skip to continue without additional details."
+    ),
+})
+
+# Valid report targets, dispatched on the first character in validate_target()
+_USERNAME_RE = re.compile(r'^@\w{5,32}$')  # Username format
+_LINK_RE = re.compile(
+    r'^https?://t\.me/(?:[\w+]+/?'  # Telegram link
+    r'|\+\w+)$'  # Private group invite
+)
 
 # User cooldown tracking
-user_cooldowns: Dict[int, datetime] = {}
+user_cooldowns: Dict[int, float] = {}  # user_id -> time.monotonic() when cooldown ends
+
+# Expired cooldowns are swept on roughly 1 in 64 /report calls,
+# checking at most this many entries per sweep
+COOLDOWN_SWEEP_SIZE = 256
+
+
+def sweep_cooldowns() -> None:
+    """Evict expired cooldown entries, oldest first.
+
+    Entries are re-inserted whenever a cooldown is set, so the dict stays
+    ordered by expiry and the sweep can stop at the first active entry.
+    """
+    now = time.monotonic()
+    for user_id, cooldown_end in list(itertools.islice(user_cooldowns.items(), COOLDOWN_SWEEP_SIZE)):
+        if cooldown_end > now:
+            break
+        del user_cooldowns[user_id]
+
+
+class OrjsonRequest(HTTPXRequest):
+    """HTTPX request backend that decodes Telegram responses with orjson."""
+
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> Dict[str, Any]:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError as exc:
+            logger.error("Can not load invalid JSON data: %r", payload)
+            raise TelegramError("Invalid server response") from exc
+
 
 class ReportBot:
     def __init__(self):
-        self.application = None
+        self.reports = None
+        self._report_queue = None  # Created in run(), on the running event loop
         
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Send a welcome message when /start is issued."""
@@ -86,57 +228,49 @@ class ReportBot:
         user_id = update.effective_user.id
         
         # Check cooldown
-        if user_id in user_cooldowns:
-            cooldown_end = user_cooldowns[user_id]
-            if datetime.now() < cooldown_end:
-                remaining = (cooldown_end - datetime.now()).seconds
-                await update.message.reply_text(
-                    f"⏰ Please wait {remaining} seconds before creating another report."
-                )
-                return ConversationHandler.END
-        
-        # Create inline keyboard for report types
-        keyboard = [
-            [InlineKeyboardButton(REPORT_TYPES['user'], callback_data='type_user')],
-            [InlineKeyboardButton(REPORT_TYPES['group'], callback_data='type_group')],
-            [InlineKeyboardButton(REPORT_TYPES['channel'], callback_data='type_channel')],
-            [InlineKeyboardButton('❌ Cancel', callback_data='cancel')]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
+        now = time.monotonic()
+        cooldown_end = user_cooldowns.get(user_id, 0.0)
+        if now < cooldown_end:
+            remaining = int(cooldown_end - now)
+            await update.message.reply_text(
+                f"⏰ Please wait {remaining} seconds before creating another report."
+            )
+            return ConversationHandler.END
+
+        # Occasionally drop expired cooldowns so the dict tracks only active users
+        if random.getrandbits(6) == 0:
+            sweep_cooldowns()
+
         await update.message.reply_text(
             "🔍 **What would you like to report?**\n\n"
             "Please select one of the options below:",
-            reply_markup=reply_markup,
+            reply_markup=_TYPE_KEYBOARD,
             parse_mode='Markdown'
         )
         
         return REPORT_TYPE
 
-    async def report_type_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-        """Handle report type selection."""
+    async def selection_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+        """Handle report type and reason selection."""
         query = update.callback_query
         await query.answer()
         
-        if query.data == 'cancel':
-            await query.edit_message_text("❌ Report cancelled.")
-            return ConversationHandler.END
-        
-        # Store report type in context
-        report_type = query.data.replace('type_', '')
-        context.user_data['report_type'] = report_type
+        # Store the selection in context and prompt for the next step
+        prefix, _, value = query.data.partition('_')
+        key, next_state, labels, prompt = _SELECTION_STEPS[prefix]
+        label = labels[value]
+        context.user_data[key] = value
         
         await query.edit_message_text(
-            f"📝 You selected: **{REPORT_TYPES[report_type]}**\n\n"
-            f"Please send the username or invite link of the {report_type} you want to report.\n\n"
-            f"Examples:\n"
-            f"• Username: @username\n"
-            f"• Link: https://t.me/username\n"
-            f"• Group link: https://t.me/+abc123...",
+            prompt.format(
+                value=value,
+                label=label,
+                max_length=config.MAX_REPORT_LENGTH
+            ),
             parse_mode='Markdown'
         )
         
-        return REPORT_TARGET
+        return next_state
 
     async def report_target(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Store the target username/link."""
@@ -155,53 +289,14 @@ class ReportBot:
         
         context.user_data['report_target'] = target
         
-        # Create keyboard for report reasons
-        reasons = {
-            'spam': '📧 Spam',
-            'scam': '💰 Scam/Fraud',
-            'harassment': '⚠️ Harassment',
-            'illegal': '🚫 Illegal Content',
-            'impersonation': '👤 Impersonation',
-            'other': '📌 Other'
-        }
-        
-        keyboard = [
-            [InlineKeyboardButton(reason, callback_data=f'reason_{key}')]
-            for key, reason in reasons.items()
-        ]
-        keyboard.append([InlineKeyboardButton('❌ Cancel', callback_data='cancel')])
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
         await update.message.reply_text(
             "⚠️ **Select a reason for your report:**",
-            reply_markup=reply_markup,
+            reply_markup=_REASON_KEYBOARD,
             parse_mode='Markdown'
         )
         
         return REPORT_REASON
 
-    async def report_reason_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-        """Handle reason selection."""
-        query = update.callback_query
-        await query.answer()
-        
-        if query.data == 'cancel':
-            await query.edit_message_text("❌ Report cancelled.")
-            return ConversationHandler.END
-        
-        reason = query.data.replace('reason_', '')
-        context.user_data['report_reason'] = reason
-        
-        await query.edit_message_text(
-            "📝 **Please provide additional details:**\n\n"
-            "Include any relevant information that might help us investigate this report.\n"
-            f"Maximum {config.MAX_REPORT_LENGTH} characters.\n\n"
-            "Send /skip to continue without additional details.",
-            parse_mode='Markdown'
-        )
-        
-        return REPORT_DETAILS
-
     async def report_details(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Store additional details."""
         details = update.message.text.strip()
@@ -225,27 +320,18 @@ class ReportBot:
         """Show report summary for confirmation."""
         user_data = context.user_data
         
-        summary = (
-            "📋 **Please confirm your report:**\n\n"
-            f"**Type:** {REPORT_TYPES[user_data['report_type']]}\n"
-            f"**Target:** {user_data['report_target']}\n"
-            f"**Reason:** {user_data['report_reason'].capitalize()}\n"
-            f"**Details:** {user_data['report_details'][:200]}"
+        summary = _SUMMARY_TMPL.format(
+            type=REPORT_TYPES[user_data['report_type']],
+            target=user_data['report_target'],
+            reason=_REASON_LABELS[user_data['report_reason']],
+            details=user_data['report_details'][:200]
         )
         
-        keyboard = [
-            [
-                InlineKeyboardButton('✅ Confirm', callback_data='confirm'),
-                InlineKeyboardButton('❌ Cancel', callback_data='cancel')
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-        
         # Handle both message and callback query contexts
         if update.message:
-            await update.message.reply_text(summary, reply_markup=reply_markup, parse_mode='Markdown')
+            await update.message.reply_text(summary, reply_markup=_CONFIRM_KEYBOARD, parse_mode='Markdown')
         else:
-            await update.callback_query.edit_message_text(summary, reply_markup=reply_markup, parse_mode='Markdown')
+            await update.callback_query.edit_message_text(summary, reply_markup=_CONFIRM_KEYBOARD, parse_mode='Markdown')
         
         return CONFIRMATION
 
@@ -254,16 +340,13 @@ class ReportBot:
         query = update.callback_query
         await query.answer()
         
-        if query.data == 'cancel':
-            await query.edit_message_text("❌ Report cancelled.")
-            return ConversationHandler.END
-        
         # Save the report
         await self.save_report(update, context)
         
         # Set cooldown
         user_id = update.effective_user.id
-        user_cooldowns[user_id] = datetime.now() + timedelta(seconds=config.REPORT_COOLDOWN)
+        user_cooldowns.pop(user_id, None)
+        user_cooldowns[user_id] = time.monotonic() + config.REPORT_COOLDOWN
         
         await query.edit_message_text(
             "✅ **Report submitted successfully!**\n\n"
@@ -282,48 +365,94 @@ class ReportBot:
         user_data = context.user_data
         user = update.effective_user
         
-        report_text = (
-            f"🚨 **NEW REPORT**\n\n"
-            f"**Report ID:** #{datetime.now().strftime('%Y%m%d%H%M%S')}\n"
-            f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            f"**Reporter:** {user.full_name} (ID: `{user.id}`)\n"
-            f"**Type:** {REPORT_TYPES[user_data['report_type']]}\n"
-            f"**Target:** {user_data['report_target']}\n"
-            f"**Reason:** {user_data['report_reason'].capitalize()}\n"
-            f"**Details:** {user_data['report_details']}\n"
+        # Read the clock once: local time for display, tz-aware for the database
+        now = datetime.now(timezone.utc).astimezone()
+        rid = now.strftime('%Y%m%d%H%M%S')
+        report_text = _REPORT_TMPL.format(
+            rid=rid,
+            date=now.strftime('%Y-%m-%d %H:%M:%S'),
+            name=user.full_name,
+            uid=user.id,
+            type=REPORT_TYPES[user_data['report_type']],
+            target=user_data['report_target'],
+            reason=_REASON_LABELS[user_data['report_reason']],
+            details=user_data['report_details']
         )
         
-        # Send to report channel if configured
+        # Queue the report for the background database writer
+        if self.reports is not None:
+            self._report_queue.put_nowait({
+                'report_id': rid,
+                'created_at': now,
+                'reporter_id': user.id,
+                'reporter_name': user.full_name,
+                'type': user_data['report_type'],
+                'target': user_data['report_target'],
+                'reason': user_data['report_reason'],
+                'details': user_data['report_details'],
+                'status': 'pending'
+            })
+
+        # Add action buttons for admins
+        reply_markup = _admin_keyboard(user.id)
+
+        # Send to report channel (if configured) and all admins concurrently
+        destinations = []  # Chat ids, parallel to tasks
+        tasks = []
         if config.REPORT_CHANNEL_ID:
-            try:
-                await context.bot.send_message(
-                    chat_id=config.REPORT_CHANNEL_ID,
-                    text=report_text,
-                    parse_mode='Markdown'
-                )
-            except Exception as e:
-                logger.error(f"Failed to send report to channel: {e}")
-        
-        # Send to admins
+            destinations.append(config.REPORT_CHANNEL_ID)
+            tasks.append(context.bot.send_message(
+                chat_id=config.REPORT_CHANNEL_ID,
+                text=report_text,
+                parse_mode='Markdown'
+            ))
         for admin_id in config.ADMIN_IDS:
-            try:
-                # Add action buttons for admins
-                keyboard = [
-                    [
-                        InlineKeyboardButton('✅ Resolve', callback_data=f'resolve_{user.id}'),
-                        InlineKeyboardButton('❌ Reject', callback_data=f'reject_{user.id}')
-                    ]
-                ]
-                reply_markup = InlineKeyboardMarkup(keyboard)
-                
-                await context.bot.send_message(
-                    chat_id=admin_id,
-                    text=report_text,
-                    reply_markup=reply_markup,
-                    parse_mode='Markdown'
-                )
-            except Exception as e:
-                logger.error(f"Failed to send report to admin {admin_id}: {e}")
+            destinations.append(admin_id)
+            tasks.append(context.bot.send_message(
+                chat_id=admin_id,
+                text=report_text,
+                reply_markup=reply_markup,
+                parse_mode='Markdown'
+            ))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for destination, result in zip(destinations, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to send report to chat %s: %s", destination, result)
+
+    async def _flush_reports(self):
+        """Write queued reports to MongoDB in batches until a None sentinel arrives."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            report = await self._report_queue.get()
+            if report is None:
+                break
+            batch = [report]
+
+            # Keep collecting until the batch is full or the flush interval passes
+            deadline = loop.time() + config.REPORT_FLUSH_INTERVAL
+            while len(batch) < config.REPORT_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    report = await asyncio.wait_for(self._report_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if report is None:
+                    stopping = True
+                    break
+                batch.append(report)
+
+            await self._write_reports(batch)
+
+    async def _write_reports(self, batch):
+        """Insert a batch of reports without blocking the event loop."""
+        try:
+            await asyncio.to_thread(self.reports.insert_many, batch, ordered=False)
+        except Exception as e:
+            logger.error("Failed to save %d reports to database: %s", len(batch), e)
 
     async def my_reports(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Show user's recent reports."""
@@ -338,16 +467,11 @@ class ReportBot:
         query = update.callback_query
         await query.answer()
         
-        if query.data.startswith('resolve'):
-            await query.edit_message_text(
-                query.message.text + "\n\n✅ **Report resolved by admin**",
-                parse_mode='Markdown'
-            )
-        elif query.data.startswith('reject'):
-            await query.edit_message_text(
-                query.message.text + "\n\n❌ **Report rejected by admin**",
-                parse_mode='Markdown'
-            )
+        action = query.data.split('_', 1)[0]
+        await query.edit_message_text(
+            query.message.text + "\n\n" + _ADMIN_VERDICTS[action],
+            parse_mode='Markdown'
+        )
 
     async def cancel(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Cancel the conversation."""
@@ -356,33 +480,64 @@ class ReportBot:
         )
         return ConversationHandler.END
 
+    async def cancel_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+        """Handle the inline Cancel button in any report step."""
+        query = update.callback_query
+        await query.answer()
+        await query.edit_message_text("❌ Report cancelled.")
+        return ConversationHandler.END
+
     def validate_target(self, target: str) -> bool:
         """Validate report target format."""
-        patterns = [
-            r'^@\w{5,32}$',  # Username format
-            r'^https?://t\.me/[\w\+]+/?$',  # Telegram link
-            r'^https?://t\.me/\+[\w]+$',  # Private group invite
-        ]
-        
-        return any(re.match(pattern, target) for pattern in patterns)
+        if not target:
+            return False
+        first = target[0]
+        if first == '@':
+            return _USERNAME_RE.match(target) is not None
+        if first == 'h':
+            return _LINK_RE.match(target) is not None
+        return False
 
     def setup(self):
         """Set up the bot application and handlers."""
         # Create application
-        self.application = Application.builder().token(config.BOT_TOKEN).build()
+        self.application = (
+            Application.builder()
+            .token(config.BOT_TOKEN)
+            .request(OrjsonRequest(connection_pool_size=32, pool_timeout=20.0))
+            .get_updates_request(OrjsonRequest(connection_pool_size=4, pool_timeout=30.0))
+            .rate_limiter(AIORateLimiter(
+                overall_max_rate=30,
+                overall_time_period=1,
+                group_max_rate=20,
+                group_time_period=60,
+                max_retries=3
+            ))
+            .build()
+        )
 
         # Conversation handler for reporting
+        cancel_handler = CallbackQueryHandler(self.cancel_callback, pattern='^cancel$')
         conv_handler = ConversationHandler(
             entry_points=[CommandHandler('report', self.report_command)],
             states={
-                REPORT_TYPE: [CallbackQueryHandler(self.report_type_callback, pattern='^(type_|cancel)')],
+                REPORT_TYPE: [
+                    cancel_handler,
+                    CallbackQueryHandler(self.selection_callback, pattern='^type_')
+                ],
                 REPORT_TARGET: [MessageHandler(filters.TEXT & ~filters.COMMAND, self.report_target)],
-                REPORT_REASON: [CallbackQueryHandler(self.report_reason_callback, pattern='^(reason_|cancel)')],
+                REPORT_REASON: [
+                    cancel_handler,
+                    CallbackQueryHandler(self.selection_callback, pattern='^reason_')
+                ],
                 REPORT_DETAILS: [
                     MessageHandler(filters.TEXT & ~filters.COMMAND, self.report_details),
                     CommandHandler('skip', self.skip_details)
                 ],
-                CONFIRMATION: [CallbackQueryHandler(self.confirmation_callback, pattern='^(confirm|cancel)$')],
+                CONFIRMATION: [
+                    cancel_handler,
+                    CallbackQueryHandler(self.confirmation_callback, pattern='^confirm$')
+                ],
             },
             fallbacks=[CommandHandler('cancel', self.cancel)],
         )
@@ -392,32 +547,86 @@ class ReportBot:
         self.application.add_handler(CommandHandler("help", self.help_command))
         self.application.add_handler(CommandHandler("myreports", self.my_reports))
         self.application.add_handler(conv_handler)
-        self.application.add_handler(CallbackQueryHandler(self.admin_callback, pattern='^(resolve|reject)'))
+        self.application.add_handler(CallbackQueryHandler(self.admin_callback, pattern='^(resolve|reject)_'))
 
     async def run(self):
         """Run the bot."""
+        # Stop cleanly on Ctrl+C and on SIGTERM, which Railway sends on redeploy
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                # Windows: Ctrl+C cancels run() instead, which still reaches the finally below
+                pass
+
         await self.application.initialize()
         await self.application.start()
-        await self.application.updater.start_polling()
-        
-        logger.info("Bot started. Press Ctrl+C to stop.")
-        
-        # Keep the bot running
+
+        client = None
+        flush_task = None
         try:
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
+            # Store reports in MongoDB if configured. The constructor resolves
+            # SRV records, so build the client off the event loop.
+            if config.MONGODB_URI:
+                try:
+                    client = await asyncio.to_thread(
+                        MongoClient, config.MONGODB_URI, tlsCAFile=certifi.where()
+                    )
+                except Exception as e:
+                    logger.error("Failed to connect to MongoDB, reports will not be stored: %s", e)
+                else:
+                    self.reports = client[config.DATABASE_NAME]['reports']
+                    self._report_queue = asyncio.Queue()
+                    flush_task = asyncio.create_task(self._flush_reports())
+
+            if config.WEBHOOK_URL:
+                # Let Telegram push updates instead of polling getUpdates
+                await self.application.updater.start_webhook(
+                    listen='0.0.0.0',
+                    port=config.PORT,
+                    url_path=config.BOT_TOKEN,
+                    webhook_url=f"{config.WEBHOOK_URL.rstrip('/')}/{config.BOT_TOKEN}"
+                )
+                logger.info("Bot started in webhook mode. Press Ctrl+C to stop.")
+            else:
+                # No public URL configured (local development), fall back to polling
+                await self.application.updater.start_polling(
+                    timeout=50,
+                    poll_interval=0,
+                    bootstrap_retries=-1
+                )
+                logger.info("Bot started in polling mode. Press Ctrl+C to stop.")
+
+            # Keep the bot running until a stop signal arrives
+            await stop_event.wait()
             logger.info("Stopping bot...")
         finally:
-            await self.application.updater.stop()
+            if self.application.updater.running:
+                await self.application.updater.stop()
             await self.application.stop()
+            # Let the writer drain the queue and finish any in-flight insert
+            # before the client is closed
+            if flush_task is not None:
+                self._report_queue.put_nowait(None)
+                await flush_task
+            if client is not None:
+                client.close()
             await self.application.shutdown()
 
 def main():
     """Main function to run the bot."""
+    # Use the faster libuv-based event loop when available
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     bot = ReportBot()
     bot.setup()
-    
+
     # Run the bot
     asyncio.run(bot.run())
 